@@ -1,23 +1,40 @@
 # SPDX-License-Identifier: MIT
 # Copyright 2026 Roland Dreier <roland@rolandd.dev>
 
-import requests
+# /// script
+# requires-python = ">=3.13"
+# dependencies = [
+#     "httpx[http2]>=0.28.1",
+# ]
+# ///
+
+import asyncio
+import httpx
 import os
 import sys
 import json
 
-def main():
+async def main():
     token = os.getenv("STRAVA_ACCESS_TOKEN")
     if not token:
         print("❌ STRAVA_ACCESS_TOKEN is missing.")
         sys.exit(1)
 
     print(f"🔑 Testing Token: {token[:6]}...{token[-4:]}")
-    headers = {"Authorization": f"Bearer {token}"}
+    headers = {"User-Agent": "midpen-tracker/1.0", "Authorization": f"Bearer {token}"}
 
     # TEST 1: Get Athlete Profile (Who is this?)
     print("\n1. Fetching Athlete Profile...")
-    r = requests.get("https://www.strava.com/api/v3/athlete", headers=headers)
+
+    # Both requests go out together over one HTTP/2 connection; the scope
+    # check below is read from the athlete response headers.
+    async with httpx.AsyncClient(
+        base_url="https://www.strava.com/api/v3", http2=True, timeout=30.0, headers=headers
+    ) as client:
+        r, r2 = await asyncio.gather(
+            client.get("/athlete"),
+            client.get("/athlete/activities", params={"per_page": 3}),
+        )
 
     print(f"   Raw Response: {r.text}")
     print(f"   Raw Headers: {r.headers}")
@@ -44,8 +61,6 @@ def main():
     # TEST 3: List Last 3 Activities
     # This checks if we can see *any* activities at all.
     print("\n3. Listing last 3 activities for this athlete...")
-    r2 = requests.get("https://www.strava.com/api/v3/athlete/activities?per_page=3", headers=headers)
-    
     if r2.status_code == 200:
         activities = r2.json()
         print(f"   ✅ Found {len(activities)} activities.")
@@ -55,4 +70,4 @@ def main():
         print(f"   ❌ FAILED to list activities. Status: {r2.status_code}")
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -3,12 +3,29 @@
 # SPDX-License-Identifier: MIT
 # Copyright 2026 Roland Dreier <roland@rolandd.dev>
 
-
-import requests
+# /// script
+# requires-python = ">=3.13"
+# dependencies = [
+#     "httpx[http2]>=0.28.1",
+#     "orjson>=3.11.4",
+# ]
+# ///
+
+import asyncio
+import httpx
 import json
+import orjson
 import os
 import sys
 import argparse
+from pathlib import Path
+
+STRAVA_API = "https://www.strava.com/api/v3"
+
+# Max in-flight Strava requests in batch mode; Strava only allows about
+# 100 requests per 15 minutes, so don't fire a long ID list all at once
+STRAVA_CONCURRENCY = 4
+
 
 def main():
     # 1. Get Token from Environment
@@ -20,58 +37,116 @@ def main():
 
     # 2. Parse Command Line Arguments
     parser = argparse.ArgumentParser(description="Download detailed Strava activity JSON.")
-    parser.add_argument("activity_id", help="The ID of the Strava activity to fetch")
+    parser.add_argument(
+        "activity_ids",
+        nargs="+",
+        metavar="activity_id",
+        help="The ID of the Strava activity to fetch (several may be given)",
+    )
     args = parser.parse_args()
 
-    activity_id = args.activity_id
-
     # 3. Setup Request
-    url = f"https://www.strava.com/api/v3/activities/{activity_id}?include_all_efforts=false"
     headers = {"Authorization": f"Bearer {access_token}"}
 
-    print(f"Fetching Activity {activity_id}...")
-
     try:
-        response = requests.get(url, headers=headers)
+        if len(args.activity_ids) == 1:
+            activity_id = args.activity_ids[0]
+            print(f"Fetching Activity {activity_id}...")
+            with httpx.Client(
+                http2=True,
+                timeout=30.0,
+                headers={"User-Agent": "midpen-tracker/1.0", **headers},
+            ) as client:
+                response = client.get(
+                    f"{STRAVA_API}/activities/{activity_id}",
+                    params={"include_all_efforts": "false"},
+                )
+            ok = save_activity(activity_id, response)
+        else:
+            print(f"Fetching {len(args.activity_ids)} activities...")
+            ok = all(asyncio.run(fetch_many(args.activity_ids, headers)))
+
+    except httpx.HTTPError as e:
+        print(f"❌ Network Error: {e}")
+        sys.exit(1)
 
-        if response.status_code != 200:
-            print(f"\n❌ API Request Failed: {response.status_code}")
-            print(f"   Your Token Scopes: {response.headers.get('X-OAuth-Scopes', 'Unknown')}")
+    if not ok:
+        sys.exit(1)
 
-            # 2. Try to print the detailed JSON error from Strava
-            try:
-                error_body = response.json()
-                print(f"   Error Details: {json.dumps(error_body, indent=2)}")
-            except:
-                print(f"   Raw Response: {response.text}")
 
-            sys.exit(1)
+async def fetch_many(activity_ids, headers):
+    """
+    Fetch and save several activities in parallel, at most
+    STRAVA_CONCURRENCY at a time.
+    Returns a list of per-activity success flags.
+    """
+    semaphore = asyncio.Semaphore(STRAVA_CONCURRENCY)
+
+    async with httpx.AsyncClient(
+        base_url=STRAVA_API,
+        http2=True,
+        timeout=30.0,
+        headers={"User-Agent": "midpen-tracker/1.0", **headers},
+    ) as client:
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(fetch_one(client, semaphore, activity_id))
+                for activity_id in activity_ids
+            ]
+
+    return [task.result() for task in tasks]
+
+
+async def fetch_one(client, semaphore, activity_id):
+    try:
+        async with semaphore:
+            response = await client.get(
+                f"/activities/{activity_id}", params={"include_all_efforts": "false"}
+            )
+    except httpx.HTTPError as e:
+        print(f"❌ Network Error fetching {activity_id}: {e}")
+        return False
+
+    return save_activity(activity_id, response)
+
+
+def save_activity(activity_id, response):
+    """
+    Check a Strava response and save the activity JSON to disk.
+    Returns True on success.
+    """
+    if response.status_code != 200:
+        print(f"\n❌ API Request Failed for {activity_id}: {response.status_code}")
+        print(f"   Your Token Scopes: {response.headers.get('X-OAuth-Scopes', 'Unknown')}")
+
+        # 2. Try to print the detailed JSON error from Strava
+        try:
+            error_body = response.json()
+            print(f"   Error Details: {json.dumps(error_body, indent=2)}")
+        except:
+            print(f"   Raw Response: {response.text}")
 
         # Check for common Strava errors
         if response.status_code == 401:
             print("❌ Error: 401 Unauthorized. Your access token is likely expired or invalid.")
-            sys.exit(1)
         elif response.status_code == 404:
             print(f"❌ Error: Activity {activity_id} not found.")
-            sys.exit(1)
 
-        response.raise_for_status()
-        data = response.json()
+        return False
 
-        # 4. Save to File
-        filename = f"activity_{activity_id}.json"
-        with open(filename, "w") as f:
-            json.dump(data, f, indent=2)
+    data = orjson.loads(response.content)
 
-        # Check if we got the high-res polyline
-        polyline_status = "✅ Found high-res polyline" if data.get("map", {}).get("polyline") else "⚠️  Warning: No detailed polyline found"
+    # 4. Save to File
+    filename = f"activity_{activity_id}.json"
+    Path(filename).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
 
-        print(f"✅ Saved to {filename}")
-        print(f"   {polyline_status}")
+    # Check if we got the high-res polyline
+    polyline_status = "✅ Found high-res polyline" if data.get("map", {}).get("polyline") else "⚠️  Warning: No detailed polyline found"
+
+    print(f"✅ Saved to {filename}")
+    print(f"   {polyline_status}")
+    return True
 
-    except requests.exceptions.RequestException as e:
-        print(f"❌ Network Error: {e}")
-        sys.exit(1)
 
 if __name__ == "__main__":
     main()
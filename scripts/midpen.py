@@ -9,28 +9,101 @@
 #     "contextily>=1.7.0",
 #     "geopandas>=1.1.2",
 #     "matplotlib>=3.10.8",
-#     "osmnx>=2.0.7",
+#     "numpy>=2.3.4",
+#     "orjson>=3.11.4",
+#     "pyproj>=3.7.2",
 #     "requests>=2.32.5",
+#     "requests-cache>=1.2.1",
 #     "shapely>=2.1.2",
 # ]
 # ///
 
-import requests
-import json
+import argparse
+import functools
+import gzip
+import hashlib
 import os
-import geopandas as gpd
-import osmnx as ox
-import matplotlib.pyplot as plt
-import contextily as ctx
-from shapely.geometry import shape, mapping
-from shapely.ops import unary_union
-from shapely.validation import make_valid
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+import numpy as np
+import shapely
+import orjson
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from pyproj import Transformer
+from shapely import wkb
+from shapely.strtree import STRtree
 
 # Road buffer distance in meters
 ROAD_BUFFER_METERS = 50
 
+# ArcGIS and Overpass responses change rarely, so keep them on disk for a week
+SESSION = requests_cache.CachedSession(
+    cache_name="data/.http_cache",
+    backend="sqlite",
+    expire_after=7 * 86400,
+    allowable_methods=("GET", "POST"),
+)
+SESSION.headers.update({"User-Agent": "Mozilla/5.0"})
+# One keep-alive pool for every request, retrying rate limits and gateway errors.
+# The Overpass POST is a read-only query, so it is safe to retry too.
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_maxsize=10,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 502, 503, 504],
+            allowed_methods=["GET", "POST"],
+        ),
+    ),
+)
+
+# Max in-flight ArcGIS query pages when a layer exceeds maxRecordCount
+ARCGIS_PAGE_CONCURRENCY = 4
+
+# Shared basemap raster for the comparison images. The zoom is fixed because
+# "auto" would pick one suited to the whole region, too coarse for a preserve.
+BASEMAP_CACHE_DIR = "data/.basemap_cache"
+BASEMAP_ZOOM = 14
+
+# California Albers: metric and accurate across the whole Midpen region
+PROJECTED_CRS = 3310
+
+OVERPASS_URL = "https://overpass-api.de/api/interpreter"
+
+# Road types that are driveable by cars
+DRIVEABLE_HIGHWAYS = (
+    "motorway",
+    "trunk",
+    "primary",
+    "secondary",
+    "tertiary",
+    "motorway_link",
+    "trunk_link",
+    "primary_link",
+    "secondary_link",
+    "tertiary_link",
+    "residential",
+    "unclassified",
+)
+
+# Overpass tag filter matching exactly the highway values above
+HIGHWAY_FILTER = f'["highway"~"^({"|".join(DRIVEABLE_HIGHWAYS)})$"]'
+
 
 def main():
+    parser = argparse.ArgumentParser(description="Download Midpen preserve boundaries.")
+    parser.add_argument(
+        "--emit-images",
+        action="store_true",
+        help="also render before/after comparison images for each preserve",
+    )
+    args = parser.parse_args()
+
     print("1. Searching ArcGIS Catalog for Midpen's 'Preserve Boundary'...")
 
     # 1. Search
@@ -40,10 +113,9 @@ def main():
         "f": "json",
         "num": 20,
     }
-    headers = {"User-Agent": "Mozilla/5.0"}
 
     try:
-        resp = requests.get(search_url, params=params, headers=headers)
+        resp = SESSION.get(search_url, params=params)
         resp.raise_for_status()
         results = resp.json().get("results", [])
 
@@ -68,7 +140,7 @@ def main():
 
         # 2. Inspect Metadata (Future-Proofing)
         print(f"2. Inspecting layer metadata at: {layer_url}")
-        meta_resp = requests.get(f"{layer_url}?f=json", headers=headers)
+        meta_resp = SESSION.get(f"{layer_url}?f=json")
         meta_data = meta_resp.json()
 
         all_fields = [f["name"] for f in meta_data.get("fields", [])]
@@ -101,12 +173,12 @@ def main():
         }
 
         print("3. Downloading data...")
-        data_resp = requests.get(query_url, params=query_params, headers=headers)
-        data_resp.raise_for_status()
-        esri_data = data_resp.json()
+        esri_data, responses = query_features(query_url, query_params, meta_data)
 
         if "error" in esri_data:
             print(f"❌ API Error: {esri_data['error']}")
+            # ArcGIS reports errors with a 200, so don't let the cache keep it
+            SESSION.cache.delete(requests=[r.request for r in responses])
             return
 
         # 4. Convert & Save Raw
@@ -119,23 +191,30 @@ def main():
             os.makedirs("data")
 
         raw_path = "data/midpen_boundaries_raw.geojson"
-        with open(raw_path, "w") as f:
-            json.dump(geojson, f, indent=2)
+        write_geojson(raw_path, geojson)
         print(f"✅ Saved raw boundaries to {raw_path}")
 
         # 5. Process boundaries - subtract road buffers
-        print("5. Processing boundaries - subtracting road buffers...")
-        processed_geojson = subtract_roads_from_preserves(geojson)
+        print("5. Downloading driveable roads for all preserves...")
+        preserves = preserve_geometries(geojson)
+        roads = get_driveable_roads(preserves_bbox(preserves))
+
+        print("   Subtracting road buffers...")
+        names = [f["properties"].get("name", "Unknown") for f in geojson["features"]]
+        processed = subtract_roads_from_preserves(preserves, roads, names)
+        processed_geojson = to_feature_collection(geojson, processed)
 
         output_path = "data/midpen_boundaries.geojson"
-        with open(output_path, "w") as f:
-            json.dump(processed_geojson, f, indent=2)
-        print(f"✅ Saved processed boundaries to {output_path}")
+        data = write_geojson(output_path, processed_geojson)
+        with gzip.open(f"{output_path}.gz", "wb", compresslevel=6) as f:
+            f.write(data)
+        print(f"✅ Saved processed boundaries to {output_path} (+ .gz)")
 
         # 6. Generate comparison images
-        print("6. Generating before/after comparison images...")
-        generate_comparison_images(geojson, processed_geojson)
-        print("✅ Comparison images saved to data/preserve_comparisons/")
+        if args.emit_images:
+            print("6. Generating before/after comparison images...")
+            generate_comparison_images(geojson, preserves, processed)
+            print("✅ Comparison images saved to data/preserve_comparisons/")
 
     except Exception as e:
         import traceback
@@ -144,6 +223,17 @@ def main():
         traceback.print_exc()
 
 
+def write_geojson(path, geojson):
+    """
+    Write GeoJSON compactly, or pretty-printed when DEBUG=1 is set.
+    Returns the bytes written.
+    """
+    option = orjson.OPT_INDENT_2 if os.getenv("DEBUG") == "1" else 0
+    data = orjson.dumps(geojson, option=option)
+    Path(path).write_bytes(data)
+    return data
+
+
 def find_field(available, candidates, fallback):
     """
     Helper to find the first matching field from a candidate list (case-insensitive).
@@ -155,6 +245,71 @@ def find_field(available, candidates, fallback):
     return fallback
 
 
+def query_features(query_url, query_params, meta_data):
+    """
+    Run an ArcGIS layer query. If the layer holds more than its maxRecordCount
+    and advertises pagination support, fetch it as resultOffset /
+    resultRecordCount pages in parallel and merge them in order.
+    Returns (esri_data, responses).
+    """
+    pages = [query_params]
+
+    max_records = meta_data.get("maxRecordCount")
+    oid_field = meta_data.get("objectIdField")
+    # A server that ignores resultOffset would hand back the first page over
+    # and over, so only page when the layer says it supports it
+    can_page = bool(
+        meta_data.get("advancedQueryCapabilities", {}).get("supportsPagination")
+        and oid_field
+    )
+
+    if max_records:
+        count_resp = SESSION.get(
+            query_url, params={**query_params, "returnCountOnly": "true"}
+        )
+        count_resp.raise_for_status()
+        total = orjson.loads(count_resp.content).get("count")
+
+        if total is None:
+            # Count not supported; don't cache the error, just try one query
+            SESSION.cache.delete(requests=[count_resp.request])
+        elif total > max_records and not can_page:
+            print(
+                f"   ⚠️  Layer has {total} features but no pagination support; "
+                f"only the first {max_records} will be downloaded"
+            )
+        elif total > max_records:
+            print(f"   Fetching {total} features in pages of {max_records}...")
+            pages = [
+                {
+                    **query_params,
+                    # Paging is only stable with an explicit sort order
+                    "orderByFields": oid_field,
+                    "resultOffset": offset,
+                    "resultRecordCount": max_records,
+                }
+                for offset in range(0, total, max_records)
+            ]
+
+    with ThreadPoolExecutor(max_workers=ARCGIS_PAGE_CONCURRENCY) as pool:
+        responses = list(
+            pool.map(lambda params: SESSION.get(query_url, params=params), pages)
+        )
+
+    esri_data = None
+    for resp in responses:
+        resp.raise_for_status()
+        page = orjson.loads(resp.content)
+        if "error" in page:
+            return page, responses
+        if esri_data is None:
+            esri_data = page
+        else:
+            esri_data.setdefault("features", []).extend(page.get("features", []))
+
+    return esri_data, responses
+
+
 def convert_esri_to_geojson(esri_data, name_key, url_key):
     features = []
     for feature in esri_data.get("features", []):
@@ -179,214 +334,357 @@ def convert_esri_to_geojson(esri_data, name_key, url_key):
     return {"type": "FeatureCollection", "features": features}
 
 
-def subtract_roads_from_preserves(geojson):
+def preserve_geometries(geojson):
     """
-    For each preserve, download driveable roads from OSM and subtract a buffer around them.
+    Build every preserve polygon from the GeoJSON rings in one vectorized call.
+    Returns a numpy array of valid WGS84 geometries, one per feature. A feature
+    whose rings can't be built gets None, so it keeps its raw geometry.
     """
-    processed_features = []
+    features = geojson["features"]
+    ring_lists = [feature["geometry"].get("coordinates") or [] for feature in features]
+    has_rings = np.array([len(rings) > 0 for rings in ring_lists], dtype=bool)
 
-    for i, feature in enumerate(geojson["features"]):
-        name = feature["properties"].get("name", "Unknown")
-        print(f"   Processing {i + 1}/{len(geojson['features'])}: {name}")
-
-        try:
-            # Convert to shapely geometry
-            geom = shape(feature["geometry"])
-
-            # Get bounding box (minx, miny, maxx, maxy)
-            bounds = geom.bounds
-
-            # Download driveable roads from OSM within the bounding box
-            # Using a slightly expanded bbox to catch roads at edges
-            buffer_deg = 0.001  # ~100m buffer for road query
-            # bbox format for osmnx 2.x: (west, south, east, north) = (minx, miny, maxx, maxy)
-            bbox = (
-                bounds[0] - buffer_deg,
-                bounds[1] - buffer_deg,
-                bounds[2] + buffer_deg,
-                bounds[3] + buffer_deg,
+    geoms = np.full(len(features), None, dtype=object)
+    for i in np.flatnonzero(~has_rings):
+        name = features[i]["properties"].get("name", "Unknown")
+        print(f"      ⚠️  Warning: {name} has no rings, keeping raw geometry")
+
+    try:
+        coords = []
+        ring_ids = []
+        polygon_ids = []
+        for k, i in enumerate(np.flatnonzero(has_rings)):
+            for ring in ring_lists[i]:
+                coords.append(ring)
+                ring_ids.append(np.full(len(ring), len(polygon_ids)))
+                polygon_ids.append(k)
+
+        if polygon_ids:
+            rings = shapely.linearrings(
+                np.concatenate(coords), indices=np.concatenate(ring_ids)
             )
+            # The first ring for each polygon is its shell, the rest are holes
+            geoms[has_rings] = shapely.polygons(rings, indices=polygon_ids)
 
-            road_geom = get_driveable_roads(bbox, name)
+    except Exception:
+        # One bad ring fails the whole batch, so build them one at a time
+        for i in np.flatnonzero(has_rings):
+            geoms[i] = build_polygon(features[i], ring_lists[i])
 
-            if road_geom is not None and not road_geom.is_empty:
-                # Create a GeoDataFrame to do the projection
-                gdf = gpd.GeoDataFrame(geometry=[geom], crs="EPSG:4326")
-                roads_gdf = gpd.GeoDataFrame(geometry=[road_geom], crs="EPSG:4326")
+    return make_valid_all(geoms)
 
-                # Project to a local UTM zone for accurate buffering
-                utm_crs = gdf.estimate_utm_crs()
-                gdf_utm = gdf.to_crs(utm_crs)
-                roads_utm = roads_gdf.to_crs(utm_crs)
 
-                # Make geometries valid before operations
-                preserve_geom = gdf_utm.geometry.iloc[0]
-                if not preserve_geom.is_valid:
-                    preserve_geom = make_valid(preserve_geom)
+def build_polygon(feature, rings):
+    """
+    Build a single preserve polygon, or None if its rings are unusable.
+    """
+    try:
+        return shapely.Polygon(rings[0], rings[1:])
+    except Exception as e:
+        name = feature["properties"].get("name", "Unknown")
+        print(f"      ⚠️  Warning: Could not build {name}, keeping raw geometry: {e}")
+        return None
 
-                road_unified = roads_utm.geometry.iloc[0]
-                if not road_unified.is_valid:
-                    road_unified = make_valid(road_unified)
 
-                # Buffer the roads by 50 meters
-                road_buffer = road_unified.buffer(ROAD_BUFFER_METERS)
+def make_valid_all(geoms):
+    """
+    Repair any invalid geometries in the array, leaving valid ones untouched.
+    """
+    invalid = ~shapely.is_valid(geoms)
+    geoms[invalid] = shapely.make_valid(geoms[invalid])
+    return geoms
 
-                # Subtract the road buffer from the preserve
-                new_geom = preserve_geom.difference(road_buffer)
 
-                # Validate result
-                if not new_geom.is_valid:
-                    new_geom = make_valid(new_geom)
+def preserves_bbox(preserves):
+    """
+    Bounding box covering every preserve, padded to catch roads at the edges.
+    Returns (west, south, east, north) = (minx, miny, maxx, maxy).
+    """
+    minx, miny, maxx, maxy = shapely.total_bounds(preserves)
+    buffer_deg = 0.001  # ~100m buffer for road query
+    return (
+        minx - buffer_deg,
+        miny - buffer_deg,
+        maxx + buffer_deg,
+        maxy + buffer_deg,
+    )
 
-                # Convert back to WGS84
-                result_gdf = gpd.GeoDataFrame(geometry=[new_geom], crs=utm_crs)
-                result_gdf = result_gdf.to_crs("EPSG:4326")
-                final_geom = result_gdf.geometry.iloc[0]
 
-                # Create the processed feature
-                processed_feature = {
-                    "type": "Feature",
-                    "properties": feature["properties"].copy(),
-                    "geometry": mapping(final_geom),
-                }
-            else:
-                # No roads found, keep original geometry
-                processed_feature = feature.copy()
+def subtract_roads_from_preserves(preserves, roads, names):
+    """
+    For each preserve, subtract a buffer around the nearby driveable roads.
+
+    roads is the (geometries, tags) pair from get_driveable_roads(), already
+    projected to PROJECTED_CRS. The roads within reach of some preserve (found
+    via an STRtree) are buffered together once, and every preserve with such
+    a road is clipped against that shared buffer.
+    Returns a numpy array of WGS84 geometries, one per preserve.
+    """
+    to_projected, to_wgs84 = _transformers(PROJECTED_CRS)
+
+    road_lines, road_tags = roads
+    tree = STRtree(road_lines)
+
+    projected = shapely.transform(preserves, to_projected.transform, interleaved=False)
+
+    # Any road within the buffer distance can eat into the preserve
+    preserve_idx, road_idx = tree.query(
+        projected, predicate="dwithin", distance=ROAD_BUFFER_METERS
+    )
+
+    for i, name in enumerate(names):
+        print(f"   Processing {i + 1}/{len(names)}: {name}")
 
-        except Exception as e:
-            print(f"      ⚠️  Warning: Could not process {name}: {e}")
-            processed_feature = feature.copy()
+        candidates = road_idx[preserve_idx == i]
+        print_road_stats([road_tags[j] for j in candidates])
 
-        processed_features.append(processed_feature)
+    has_roads = np.zeros(len(projected), dtype=bool)
+    has_roads[preserve_idx] = True
 
-    return {"type": "FeatureCollection", "features": processed_features}
+    # Buffer each nearby road once, shared by every preserve it touches. Roads
+    # nowhere near a preserve are left out: the query bbox covers dense urban
+    # grids, and buffering those dwarfs all the other work. The preserves were
+    # validated up front, so the differences come out valid without another
+    # make_valid.
+    nearby_roads = road_lines[np.unique(road_idx)]
+    road_buffer = shapely.buffer(shapely.union_all(nearby_roads), ROAD_BUFFER_METERS)
+    clipped = shapely.difference(projected[has_roads], road_buffer)
 
+    # Preserves with no nearby roads keep their original geometry
+    result = preserves.copy()
+    result[has_roads] = shapely.transform(
+        clipped, to_wgs84.transform, interleaved=False
+    )
+    return result
 
-def get_driveable_roads(bbox, preserve_name=""):
+
+@functools.lru_cache
+def _transformers(epsg):
     """
-    Download driveable roads from OSM within the given bounding box.
-    bbox: (west, south, east, north) = (minx, miny, maxx, maxy)
-    Returns a unified geometry of all road LineStrings, or None if no roads found.
+    (WGS84 -> epsg, epsg -> WGS84) transformer pair, built once per CRS.
     """
-    try:
-        # Define road types that are driveable by cars
-        tags = {
-            "highway": [
-                "motorway",
-                "trunk",
-                "primary",
-                "secondary",
-                "tertiary",
-                "motorway_link",
-                "trunk_link",
-                "primary_link",
-                "secondary_link",
-                "tertiary_link",
-                "residential",
-                "unclassified",
-            ]
-        }
+    return (
+        Transformer.from_crs(4326, epsg, always_xy=True),
+        Transformer.from_crs(epsg, 4326, always_xy=True),
+    )
 
-        # Download road features from OSM using the bounding box
-        gdf = ox.features_from_bbox(bbox=bbox, tags=tags)
 
-        if gdf.empty:
-            print("      📍 No driveable roads found in area")
-            return None
+def to_feature_collection(geojson, geoms):
+    """
+    Pair each feature's properties with a new geometry. The geometries are
+    serialized by GEOS in one vectorized call and embedded as raw JSON.
+    """
+    return {
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "properties": feature["properties"].copy(),
+                # Preserves that couldn't be built keep their raw geometry
+                "geometry": (
+                    orjson.Fragment(geometry)
+                    if geometry is not None
+                    else feature["geometry"]
+                ),
+            }
+            for feature, geometry in zip(geojson["features"], shapely.to_geojson(geoms))
+        ],
+    }
 
-        # Filter to only LineString geometries (roads are lines, not polygons)
-        gdf = gdf[gdf.geometry.type == "LineString"]
 
-        if gdf.empty:
+def get_driveable_roads(bbox):
+    """
+    Download driveable roads from OSM within the given bounding box.
+    bbox: (west, south, east, north) = (minx, miny, maxx, maxy)
+    Returns (lines, tags): road LineStrings projected to PROJECTED_CRS and
+    the matching OSM tag dicts.
+    """
+    west, south, east, north = bbox
+    # "out geom" returns only the matching ways, each with inline coordinates
+    query = (
+        "[out:json][timeout:180];"
+        f"way{HIGHWAY_FILTER}({south},{west},{north},{east});"
+        "out geom;"
+    )
+
+    resp = SESSION.post(OVERPASS_URL, data={"data": query})
+    resp.raise_for_status()
+    data = orjson.loads(resp.content)
+
+    # Overpass reports timeouts and out-of-memory as a 200 with a "remark" and
+    # partial elements; don't let the cache keep that as "no roads"
+    if "remark" in data:
+        SESSION.cache.delete(requests=[resp.request])
+        raise RuntimeError(f"Overpass query failed: {data['remark']}")
+
+    ways = [e for e in data.get("elements", []) if len(e.get("geometry", [])) >= 2]
+    tags = [way.get("tags", {}) for way in ways]
+
+    # Build every LineString in one call from the flattened way coordinates
+    coords = np.array(
+        [(pt["lon"], pt["lat"]) for way in ways for pt in way["geometry"]],
+        dtype=float,
+    ).reshape(-1, 2)
+    indices = np.repeat(np.arange(len(ways)), [len(way["geometry"]) for way in ways])
+    lines = shapely.linestrings(coords, indices=indices)
+
+    print(f"   📍 Found {len(lines)} road LineStrings")
+
+    to_projected, _ = _transformers(PROJECTED_CRS)
+    lines = shapely.transform(lines, to_projected.transform, interleaved=False)
+    return lines, tags
+
+
+def print_road_stats(tags):
+    """
+    Debug output: show the road types and names near a preserve.
+    """
+    if not tags:
+        print("      📍 No driveable roads found in area")
+        return
+
+    print(f"      📍 Found {len(tags)} road LineStrings")
+
+    # Show highway type breakdown
+    highway_counts = Counter(t.get("highway") for t in tags)
+    types_str = ", ".join([f"{k}={v}" for k, v in highway_counts.most_common(5)])
+    print(f"         Types: {types_str}")
+
+    # Show named roads (most relevant for our use case)
+    named_roads = list(dict.fromkeys(t["name"] for t in tags if "name" in t))
+    if len(named_roads) > 0:
+        # Show first few road names
+        sample_names = named_roads[:6]
+        if len(named_roads) > 6:
             print(
-                "      📍 No driveable roads found in area (after filtering to LineStrings)"
+                f"         Roads: {', '.join(sample_names)}, +{len(named_roads) - 6} more"
             )
-            return None
-
-        # Debug output: show road names and stats
-        print(f"      📍 Found {len(gdf)} road LineStrings")
-
-        # Show highway type breakdown
-        if "highway" in gdf.columns:
-            highway_counts = gdf["highway"].value_counts()
-            types_str = ", ".join(
-                [f"{k}={v}" for k, v in highway_counts.head(5).items()]
-            )
-            print(f"         Types: {types_str}")
-
-        # Show named roads (most relevant for our use case)
-        if "name" in gdf.columns:
-            named_roads = gdf["name"].dropna().unique()
-            if len(named_roads) > 0:
-                # Show first few road names
-                sample_names = list(named_roads[:6])
-                if len(named_roads) > 6:
-                    print(
-                        f"         Roads: {', '.join(sample_names)}, +{len(named_roads) - 6} more"
-                    )
-                else:
-                    print(f"         Roads: {', '.join(sample_names)}")
-
-        # Combine all road geometries into one
-        all_roads = unary_union(gdf.geometry)
-        return all_roads
-
-    except Exception as e:
-        print(f"      ⚠️  OSM query error: {e}")
-        return None
+        else:
+            print(f"         Roads: {', '.join(sample_names)}")
 
 
-def generate_comparison_images(raw_geojson, processed_geojson):
+def generate_comparison_images(geojson, raw_geoms, processed_geoms):
     """
     Generate before/after comparison images for each preserve.
+
+    The basemap for the whole region is downloaded once and shared by every
+    subplot; the figures are rendered in parallel worker processes.
     """
     output_dir = "data/preserve_comparisons"
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
 
-    for i, (raw_feature, proc_feature) in enumerate(
-        zip(raw_geojson["features"], processed_geojson["features"])
-    ):
-        name = raw_feature["properties"].get("name", f"preserve_{i}")
-        safe_name = "".join(
-            c if c.isalnum() or c in (" ", "-", "_") else "_" for c in name
+    basemap_path = fetch_basemap(raw_geoms)
+
+    with ProcessPoolExecutor() as pool:
+        jobs = []
+        for i, (feature, raw_wkb, proc_wkb) in enumerate(
+            zip(
+                geojson["features"],
+                shapely.to_wkb(raw_geoms),
+                shapely.to_wkb(processed_geoms),
+            )
+        ):
+            name = feature["properties"].get("name", f"preserve_{i}")
+            safe_name = "".join(
+                c if c.isalnum() or c in (" ", "-", "_") else "_" for c in name
+            )
+            jobs.append(
+                (
+                    name,
+                    pool.submit(
+                        _render_comparison,
+                        name,
+                        raw_wkb,
+                        proc_wkb,
+                        f"{output_dir}/{safe_name}.png",
+                        basemap_path,
+                    ),
+                )
+            )
+
+        for name, job in jobs:
+            try:
+                job.result()
+            except Exception as e:
+                print(f"      ⚠️  Could not generate image for {name}: {e}")
+
+
+def fetch_basemap(raw_geoms):
+    """
+    Download one Web Mercator basemap raster covering every preserve.
+    The raster is kept under BASEMAP_CACHE_DIR, keyed on its bounds and zoom.
+    Returns the path to the GeoTIFF.
+    """
+    import contextily as ctx
+    import geopandas as gpd
+
+    bounds = gpd.GeoSeries(raw_geoms, crs="EPSG:4326").to_crs(epsg=3857).total_bounds
+
+    key = hashlib.sha1(
+        f"{BASEMAP_ZOOM}:{','.join(f'{b:.0f}' for b in bounds)}".encode()
+    ).hexdigest()
+    path = os.path.join(BASEMAP_CACHE_DIR, f"midpen_{key}.tif")
+
+    if not os.path.exists(path):
+        os.makedirs(BASEMAP_CACHE_DIR, exist_ok=True)
+        ctx.bounds2raster(
+            *bounds,
+            path=path,
+            zoom=BASEMAP_ZOOM,
+            source=ctx.providers.CartoDB.Positron,
         )
+    return path
 
-        try:
-            # Create GeoDataFrames
-            raw_geom = shape(raw_feature["geometry"])
-            proc_geom = shape(proc_feature["geometry"])
 
-            raw_gdf = gpd.GeoDataFrame(geometry=[raw_geom], crs="EPSG:4326")
-            proc_gdf = gpd.GeoDataFrame(geometry=[proc_geom], crs="EPSG:4326")
+def _render_comparison(name, raw_wkb, proc_wkb, output_path, basemap_path):
+    """
+    Render one before/after figure (runs in a worker process).
+    """
+    import contextily as ctx
+    import geopandas as gpd
 
-            # Convert to Web Mercator for contextily
-            raw_gdf = raw_gdf.to_crs(epsg=3857)
-            proc_gdf = proc_gdf.to_crs(epsg=3857)
+    raw_gdf = gpd.GeoDataFrame(geometry=[wkb.loads(raw_wkb)], crs="EPSG:4326")
+    proc_gdf = gpd.GeoDataFrame(geometry=[wkb.loads(proc_wkb)], crs="EPSG:4326")
 
-            # Create figure with two subplots
-            fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 8))
+    # Convert to Web Mercator for contextily
+    raw_gdf = raw_gdf.to_crs(epsg=3857)
+    proc_gdf = proc_gdf.to_crs(epsg=3857)
 
-            # Before image
-            raw_gdf.plot(ax=ax1, facecolor="none", edgecolor="red", linewidth=2)
-            ctx.add_basemap(ax1, source=ctx.providers.CartoDB.Positron, crs=raw_gdf.crs)
-            ax1.set_title(f"{name} - Before (Raw)", fontsize=12)
-            ax1.set_axis_off()
+    fig, (ax1, ax2) = _comparison_figure()
+    ax1.clear()
+    ax2.clear()
 
-            # After image
-            proc_gdf.plot(ax=ax2, facecolor="none", edgecolor="green", linewidth=2)
-            ctx.add_basemap(
-                ax2, source=ctx.providers.CartoDB.Positron, crs=proc_gdf.crs
-            )
-            ax2.set_title(f"{name} - After (Roads Subtracted)", fontsize=12)
-            ax2.set_axis_off()
+    # Before image
+    raw_gdf.plot(ax=ax1, facecolor="none", edgecolor="red", linewidth=2)
+    ctx.add_basemap(ax1, source=basemap_path, crs=raw_gdf.crs)
+    ax1.set_title(f"{name} - Before (Raw)", fontsize=12)
+    ax1.set_axis_off()
+
+    # After image
+    proc_gdf.plot(ax=ax2, facecolor="none", edgecolor="green", linewidth=2)
+    ctx.add_basemap(ax2, source=basemap_path, crs=proc_gdf.crs)
+    ax2.set_title(f"{name} - After (Roads Subtracted)", fontsize=12)
+    ax2.set_axis_off()
+
+    # Fast zlib level: these are throwaway review images, not shipped assets
+    fig.savefig(output_path, dpi=120, pil_kwargs={"compress_level": 1})
+
+
+@functools.cache
+def _comparison_figure():
+    """
+    Figure and axes reused for every image this worker process renders.
+    The layout is fixed here so saving doesn't need a tight-bbox pass.
+    """
+    import matplotlib
 
-            plt.tight_layout()
-            plt.savefig(f"{output_dir}/{safe_name}.png", dpi=150, bbox_inches="tight")
-            plt.close(fig)
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
 
-        except Exception as e:
-            print(f"      ⚠️  Could not generate image for {name}: {e}")
+    fig, axes = plt.subplots(1, 2, figsize=(16, 8))
+    fig.subplots_adjust(left=0.01, right=0.99, bottom=0.01, top=0.95, wspace=0.02)
+    return fig, axes
 
 
 if __name__ == "__main__":